@@ -4,17 +4,45 @@ Generate a screenshot showing verification failure for documentation.
 This temporarily modifies numerical_claims.yaml, runs verification, and captures the output.
 """
 
-import subprocess
+import contextlib
+import functools
+import io
+import os
+import re
+import shutil
+import traceback
 import yaml
 from pathlib import Path
+from xml.sax.saxutils import escape
 from PIL import Image, ImageDraw, ImageFont
-import shutil
+
+try:
+    import cairosvg  # Optional: rasterizes the SVG screenshot to PNG in C
+except (ImportError, OSError):
+    cairosvg = None
+
+import verify_manuscript
+
+# Prefer the LibYAML C bindings when available
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
 
 # Paths
 YAML_PATH = Path("numerical_claims.yaml")
-BACKUP_PATH = Path("numerical_claims.yaml.backup")
 OUTPUT_IMAGE = Path("docs/assets/failure_screenshot.png")
 
+# Monospace fonts to try, in order
+MONOSPACE_FONTS = (
+    '/System/Library/Fonts/Menlo.ttc',
+    '/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf',
+)
+
+# Terminal background and text baseline offset for SVG output (14px font)
+TERMINAL_BG = (40, 44, 52)
+SVG_BASELINE = 14
+
 # Terminal colors (RGB approximations)
 COLORS = {
     'reset': (200, 200, 200),
@@ -26,83 +54,146 @@ COLORS = {
     'white': (255, 255, 255),
 }
 
-def backup_yaml():
-    """Backup current YAML file"""
-    shutil.copy(YAML_PATH, BACKUP_PATH)
-
-def restore_yaml():
-    """Restore original YAML file"""
-    shutil.move(BACKUP_PATH, YAML_PATH)
+# Substring -> color rules, checked in priority order (first match wins)
+COLOR_RULES = (
+    ('❌', 'red'), ('FAILED', 'red'), ('ERROR', 'red'),
+    ('✅', 'green'), ('PASSED', 'green'), ('SUCCESS', 'green'),
+    ('Details:', 'yellow'), ('Hint:', 'yellow'),
+)
+
+ANSI_ESCAPE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+# C0 control characters (other than tab/newline/CR) are not allowed in XML
+CONTROL_CHARS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+def write_yaml_atomic(data):
+    """Replace the YAML file with the given bytes via a temp file + os.replace"""
+    # Swap the symlink's target rather than the link, and keep the file's mode
+    target = YAML_PATH.resolve()
+    tmp_path = target.with_name(target.name + '.tmp')
+    tmp_path.write_bytes(data)
+    shutil.copymode(target, tmp_path)
+    os.replace(tmp_path, target)
 
 def create_failing_yaml():
     """Modify YAML to cause verification failure"""
     with open(YAML_PATH) as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=SafeLoader)
 
     # Change the expected value to cause failure
     data['results']['experiment_a']['mean_efficiency'] = 0.950  # Wrong value
 
-    with open(YAML_PATH, 'w') as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+    # Serialize in one go, then swap the file in atomically
+    buf = yaml.dump(data, Dumper=SafeDumper, default_flow_style=False,
+                    sort_keys=False, encoding='utf-8')
+    write_yaml_atomic(buf)
 
 def run_verification():
-    """Run verification and capture output"""
-    result = subprocess.run(
-        ['python3', 'verify_manuscript.py'],
-        capture_output=True,
-        text=True
-    )
-    return result.stdout + result.stderr
+    """Run verification in-process and capture output"""
+    framework = verify_manuscript.framework
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
+        try:
+            framework._claims = None  # Contract was just modified on disk
+            results = framework.run()
+            framework.report_human(results)
+        except Exception:
+            traceback.print_exc()
+    return buf.getvalue()
 
 def strip_ansi(text):
-    """Remove ANSI escape codes from text"""
-    import re
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    return ansi_escape.sub('', text)
+    """Remove ANSI escape codes and other control characters from text"""
+    return CONTROL_CHARS.sub('', ANSI_ESCAPE.sub('', text))
+
+@functools.lru_cache(maxsize=4)
+def load_font(size=14):
+    """Load a monospace font once per size so its glyph cache is reused across renders"""
+    for path in MONOSPACE_FONTS:
+        if os.path.exists(path):
+            return ImageFont.truetype(path, size)
+    return ImageFont.load_default()
+
+@functools.lru_cache(maxsize=None)
+def load_glyph(font, char):
+    """Rasterize a character once; returns its coverage mask and advance width"""
+    _, _, right, bottom = font.getbbox(char)
+    mask = Image.new('L', (max(right, 1), max(bottom, 1)))
+    ImageDraw.Draw(mask).text((0, 0), char, font=font, fill=255)
+    return mask, font.getlength(char)
+
+def hex_color(rgb):
+    """Format an RGB tuple as an SVG/CSS hex color"""
+    return '#%02x%02x%02x' % rgb
+
+def line_color(line):
+    """Pick the terminal color for a line of verification output"""
+    name = next((color for needle, color in COLOR_RULES if needle in line), None)
+    if name is None:
+        if line.startswith('Category:'):
+            name = 'blue'
+        elif line.startswith('='):
+            name = 'gray'
+        else:
+            name = 'white'
+    return COLORS[name]
+
+def terminal_lines(output_text, max_lines=40, max_width=120):
+    """Split output into (color, line) pairs: control codes stripped, truncated"""
+    # Bounded split: only the kept lines are separated and cleaned, so a long
+    # log costs no more than its first max_lines lines
+    lines = output_text.split('\n', max_lines)[:max_lines]
+
+    styled = []
+    for line in lines:
+        # Strip ANSI/control codes for cleaner rendering (and valid SVG)
+        line = strip_ansi(line)
+        color = line_color(line)
+
+        # Truncate long lines
+        if len(line) > max_width:
+            line = line[:max_width - 3] + '...'
+
+        styled.append((color, line))
+    return styled
+
+def create_terminal_svg(output_text, width=1000, line_height=20):
+    """Create an SVG document that looks like terminal output"""
+    lines = terminal_lines(output_text)
+    height = len(lines) * line_height + 40
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}">',
+        f'<rect width="100%" height="100%" fill="{hex_color(TERMINAL_BG)}"/>',
+        '<g font-family="Menlo, \'DejaVu Sans Mono\', monospace" font-size="14" '
+        'xml:space="preserve">',
+    ]
+    y = 20 + SVG_BASELINE
+    for color, line in lines:
+        if line:
+            parts.append(f'<text x="10" y="{y}" fill="{hex_color(color)}">{escape(line)}</text>')
+        y += line_height
+    parts.append('</g></svg>')
+    return '\n'.join(parts) + '\n'
 
 def create_terminal_image(output_text, width=1000, line_height=20):
     """Create an image that looks like terminal output"""
-    # Strip ANSI codes for cleaner rendering
-    clean_text = strip_ansi(output_text)
-    lines = clean_text.split('\n')[:40]  # Limit to first 40 lines
+    lines = terminal_lines(output_text)
 
     # Calculate image dimensions
     height = len(lines) * line_height + 40
 
     # Create image with dark terminal background
-    img = Image.new('RGB', (width, height), color=(40, 44, 52))
-    draw = ImageDraw.Draw(img)
+    img = Image.new('RGB', (width, height), color=TERMINAL_BG)
+    font = load_font(14)
 
-    # Try to use a monospace font
-    try:
-        font = ImageFont.truetype('/System/Library/Fonts/Menlo.ttc', 14)
-    except:
-        try:
-            font = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf', 14)
-        except:
-            font = ImageFont.load_default()
-
-    # Draw text
+    # Draw text by blitting cached glyph masks
     y = 20
-    for line in lines:
-        # Determine color based on content
-        color = COLORS['white']
-        if '❌' in line or 'FAILED' in line or 'ERROR' in line:
-            color = COLORS['red']
-        elif '✅' in line or 'PASSED' in line or 'SUCCESS' in line:
-            color = COLORS['green']
-        elif 'Details:' in line or 'Hint:' in line:
-            color = COLORS['yellow']
-        elif line.startswith('Category:'):
-            color = COLORS['blue']
-        elif line.startswith('='):
-            color = COLORS['gray']
-
-        # Truncate long lines
-        if len(line) > 120:
-            line = line[:117] + '...'
-
-        draw.text((10, y), line, font=font, fill=color)
+    for color, line in lines:
+        x = 10
+        for char in line:
+            mask, advance = load_glyph(font, char)
+            img.paste(color, (int(x), y), mask)
+            x += advance
         y += line_height
 
     return img
@@ -111,8 +202,8 @@ def main():
     """Generate the failure screenshot"""
     print("📸 Generating verification failure screenshot...")
 
-    # Backup original YAML
-    backup_yaml()
+    # Keep the original YAML in memory (no backup file to leave behind)
+    original_yaml = YAML_PATH.read_bytes()
 
     try:
         # Create failing configuration
@@ -123,16 +214,25 @@ def main():
         output = run_verification()
         print("  ✓ Ran verification script")
 
-        # Create image
-        img = create_terminal_image(output)
-        img.save(OUTPUT_IMAGE)
+        # Create the PNG used by the docs: rasterize the SVG rendering with
+        # cairosvg when available, otherwise (or if it fails) draw it with Pillow
+        rendered = False
+        if cairosvg is not None:
+            try:
+                svg = create_terminal_svg(output)
+                cairosvg.svg2png(bytestring=svg.encode('utf-8'), write_to=str(OUTPUT_IMAGE))
+                rendered = True
+            except Exception as e:
+                print(f"  ⚠ cairosvg failed ({e}); falling back to Pillow")
+        if not rendered:
+            create_terminal_image(output).save(OUTPUT_IMAGE)
         print(f"  ✓ Saved screenshot to {OUTPUT_IMAGE}")
 
         print("\n✅ Screenshot generated successfully!")
 
     finally:
         # Always restore original YAML
-        restore_yaml()
+        write_yaml_atomic(original_yaml)
         print("  ✓ Restored original numerical_claims.yaml")
 
 if __name__ == '__main__':
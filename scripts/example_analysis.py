@@ -10,8 +10,8 @@ This script demonstrates:
 """
 
 import json
+import math
 import numpy as np
-import matplotlib.pyplot as plt
 from datetime import datetime
 from pathlib import Path
 
@@ -22,29 +22,38 @@ OUTPUT_DIR.mkdir(exist_ok=True)
 
 def generate_example_data():
     """Generate synthetic experiment data"""
-    np.random.seed(42)
+    # Legacy seeded stream: the contract values depend on these exact samples
+    rng = np.random.RandomState(42)
     n_samples = 100
 
     # Simulate an experiment with ~85% efficiency
-    efficiencies = np.random.normal(0.85, 0.12, n_samples)
-    efficiencies = np.clip(efficiencies, 0, 1)  # Keep in [0, 1]
+    efficiencies = rng.normal(0.85, 0.12, n_samples)
+    np.clip(efficiencies, 0, 1, out=efficiencies)  # Keep in [0, 1]
 
     return efficiencies
 
 
 def calculate_statistics(data):
     """Calculate key statistics"""
+    # One sum and one dot product instead of np.mean + np.std; deviations are
+    # taken from the mean first so large offsets don't cancel out the variance
+    n = data.size
+    mean = float(data.sum()) / n
+    deviations = data - mean
+    var = float(np.dot(deviations, deviations)) / n
     return {
-        "mean_efficiency": float(np.mean(data)),
-        "std_dev": float(np.std(data)),
+        "mean_efficiency": mean,
+        "std_dev": math.sqrt(var),
         "sample_size": len(data),
         # Simplified p-value calculation (normally use scipy.stats)
         "p_value": 0.04  # Placeholder for actual statistical test
     }
 
 
-def create_figure(data, stats):
-    """Generate figure showing efficiency distribution"""
+def create_figure(data, stats, figure_path):
+    """Generate, save, and close the figure showing efficiency distribution"""
+    import matplotlib.pyplot as plt  # Deferred: heavy import only needed for plotting
+
     fig, ax = plt.subplots(figsize=(8, 5))
 
     # Histogram
@@ -60,7 +69,9 @@ def create_figure(data, stats):
     ax.legend()
     ax.grid(alpha=0.3)
 
-    return fig
+    fig.savefig(figure_path, dpi=150, bbox_inches='tight')
+    plt.close(fig)
+    return figure_path
 
 
 def save_metadata(stats, script_name, figure_id):
@@ -103,10 +114,7 @@ def main():
 
     # 3. Create figure
     print("\n3. Generating figure...")
-    fig = create_figure(data, stats)
-    figure_path = OUTPUT_DIR / "fig1_example.png"
-    fig.savefig(figure_path, dpi=150, bbox_inches='tight')
-    plt.close(fig)
+    figure_path = create_figure(data, stats, OUTPUT_DIR / "fig1_example.png")
     print(f"   ✓ Saved: {figure_path}")
 
     # 4. Save metadata for verification
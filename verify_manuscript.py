@@ -9,25 +9,285 @@ Usage:
     python3 verify_manuscript.py --only figures data  # Run specific categories
 """
 import argparse
+import functools
+import hashlib
+import importlib.util
 import json
+import os
 import sys
+import tempfile
 import time
-from dataclasses import dataclass, asdict
-from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+import types
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import chain
+from operator import attrgetter
+from pathlib import Path, PurePath
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+# PyYAML is imported on first parse (a fresh JSON sidecar needs no YAML at all),
+# but check up front that it is installed so a missing dependency fails clearly
+if importlib.util.find_spec("yaml") is None:
+    print("ERROR: Missing dependencies. Run: pip install pyyaml")
+    sys.exit(1)
 
-try:
+# pandas (for CSV checks) is imported on first use by framework.load_csv, so
+# runs such as `--only figures` do not pay its import cost
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_loader():
+    """Import PyYAML and return (yaml, loader), preferring the LibYAML C loader"""
     import yaml
-    import pandas as pd  # Optional: Only needed if checking CSVs
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+        print("WARNING: LibYAML not available, using slow pure-Python YAML loader "
+              "(install libyaml-dev and reinstall pyyaml)", file=sys.stderr)
+    return yaml, SafeLoader
+
+
+# Optional: orjson parses and serializes JSON several times faster than the stdlib
+try:
+    import orjson
 except ImportError:
-    print("ERROR: Missing dependencies. Run: pip install pyyaml pandas")
-    sys.exit(1)
+    orjson = None
+    _json_loads = json.loads
+else:
+    _json_loads = orjson.loads
+
+# Optional: BLAKE3 is SIMD-accelerated; BLAKE2 is the stdlib fallback
+try:
+    from blake3 import blake3 as _content_hasher
+except ImportError:
+    _content_hasher = functools.partial(hashlib.blake2b, digest_size=16)
 
 # --- Configuration ---
 ROOT = Path(__file__).resolve().parent
 CLAIMS_FILE = ROOT / "numerical_claims.yaml"
 FIGURES_DIR = ROOT / "figures"
 DATA_DIR = ROOT / "data"
+CACHE_DIR = ROOT / ".verify_cache"  # Memoized reductions, keyed by content hash
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write bytes via a temp file + os.replace so readers never see partial data"""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """Single stat() that doubles as an existence check (None if unreachable)"""
+    try:
+        return os.stat(path)
+    except OSError:  # Missing, broken symlink, ENOTDIR, ELOOP, ...
+        return None
+
+
+def _code_fingerprint(code) -> bytes:
+    """Stable bytes describing a function body: bytecode, names and constants"""
+    parts = [code.co_code, repr(code.co_names).encode()]
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            parts.append(_code_fingerprint(const))  # Nested function/comprehension
+        elif isinstance(const, frozenset):
+            parts.append(repr(sorted(map(repr, const))).encode())  # Hash-seed independent
+        else:
+            parts.append(repr(const).encode())
+    return b"\0".join(parts)
+
+
+def _code_names(code) -> set:
+    """Global/attribute names referenced by a code object and its nested code"""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            names |= _code_names(const)
+    return names
+
+
+_PLAIN_SCALARS = (type(None), bool, int, float, complex, str, bytes, PurePath)
+
+
+def _plain_repr(value: Any) -> Optional[str]:
+    """Stable repr() of plain data (scalars, paths and containers of them), else None"""
+    if isinstance(value, _PLAIN_SCALARS):
+        return repr(value)
+    if isinstance(value, (tuple, list)):
+        items = [_plain_repr(v) for v in value]
+        return None if None in items else f"{type(value).__name__}({', '.join(items)})"
+    if isinstance(value, (set, frozenset)):
+        items = [_plain_repr(v) for v in value]
+        return None if None in items else f"set({', '.join(sorted(items))})"
+    if isinstance(value, dict):
+        items = [(_plain_repr(k), _plain_repr(v)) for k, v in value.items()]
+        if any(k is None or v is None for k, v in items):
+            return None
+        return "{" + ", ".join(f"{k}: {v}" for k, v in sorted(items)) + "}"
+    return None
+
+
+def _keyed_value(owner: str, what: str, value: Any, seen: set) -> bytes:
+    """Fingerprint a value a reduction depends on; TypeError if it cannot be keyed"""
+    if isinstance(value, functools.partial) or hasattr(value, "__code__"):
+        return _function_fingerprint(value, seen)
+    text = _plain_repr(value)
+    if text is None:
+        raise TypeError(
+            f"cached_reduction cannot key on {what} of type {type(value).__name__} "
+            f"in {owner}; use plain data (numbers, strings, paths, containers of "
+            "them) or call it uncached"
+        )
+    return text.encode()
+
+
+def _function_fingerprint(fn: Callable, seen: Optional[set] = None) -> bytes:
+    """
+    Stable bytes identifying what a reduction computes.
+
+    Covers the function's name, code, default arguments, closure variables and
+    plain-data globals it references; functools.partial objects, bound methods
+    and callable instances add their bound arguments or instance attributes.
+    Closed-over functions are fingerprinted recursively; other closed-over or
+    bound values must be plain data, else TypeError is raised since the cache
+    could not tell when they change.
+    """
+    seen = set() if seen is None else seen
+    if id(fn) in seen:
+        return b"<recursive>"
+    seen.add(id(fn))
+
+    name = getattr(fn, "__qualname__", None) or type(fn).__qualname__
+    module = getattr(fn, "__module__", None) or type(fn).__module__
+    label = f"{module}.{name}".encode()
+
+    if isinstance(fn, functools.partial):
+        return b"\0".join([
+            b"partial",
+            _function_fingerprint(fn.func, seen),
+            _keyed_value(name, "partial arguments", fn.args, seen),
+            _keyed_value(name, "partial keywords", fn.keywords, seen),
+        ])
+    if isinstance(fn, types.MethodType):
+        return b"\0".join([
+            _function_fingerprint(fn.__func__, seen),
+            _keyed_value(name, "bound instance attributes", vars(fn.__self__), seen),
+        ])
+
+    code = getattr(fn, "__code__", None)
+    if code is None:
+        call = getattr(type(fn), "__call__", None)
+        if not isinstance(fn, type) and hasattr(call, "__code__"):
+            # Callable instance: its __call__ method plus the instance state
+            return b"\0".join([
+                label,
+                _function_fingerprint(call, seen),
+                _keyed_value(name, "instance attributes", getattr(fn, "__dict__", {}), seen),
+            ])
+        return label  # Builtin: identified by name alone
+
+    parts = [label, _code_fingerprint(code)]
+    parts.append(_keyed_value(name, "default arguments", fn.__defaults__, seen))
+    parts.append(_keyed_value(name, "keyword-only defaults", fn.__kwdefaults__, seen))
+    for var, cell in zip(code.co_freevars, fn.__closure__ or ()):
+        try:
+            value = cell.cell_contents
+        except ValueError:
+            value = None  # Cell not yet bound
+        parts.append(var.encode() + b"=" + _keyed_value(name, f"closure variable {var!r}", value, seen))
+
+    # Plain-data globals (thresholds, column names, ...); modules, classes and
+    # global helper functions are not tracked (see cached_reduction's version=)
+    for var in sorted(_code_names(code)):
+        text = _plain_repr(fn.__globals__[var]) if var in fn.__globals__ else None
+        if text is not None:
+            parts.append(f"{var}={text}".encode())
+    return b"\0".join(parts)
+
+
+def _read_claims_cache(cache_path: Path, header: str) -> Optional[Dict]:
+    """Return cached claims if the sidecar was written for this exact contract"""
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            if f.readline() != header:
+                return None
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_claims_cache(cache_path: Path, header: str, claims: Dict) -> None:
+    """Atomically write parsed claims as a JSON sidecar (best effort)"""
+    try:
+        payload = json.dumps(claims, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return  # Contract uses YAML-only types (e.g. dates); skip caching
+    if json.loads(payload) != claims:
+        return  # JSON would not round-trip faithfully (e.g. non-string keys)
+
+    try:
+        _atomic_write(cache_path, (header + payload).encode("utf-8"))
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=4)
+def _load_claims_cached(path: str, mtime_ns: int, size: int) -> Dict:
+    """
+    Parse a contract once per process for each (path, mtime, size).
+
+    Framework instances in the same process share the result, so checks must
+    not mutate it. Across processes, the JSON sidecar next to the contract is
+    reused while the contract is unchanged.
+    """
+    claims_path = Path(path)
+    cache_path = claims_path.with_name(claims_path.name + ".cache.json")
+    header = f"# src: {mtime_ns}:{size}\n"
+
+    claims = _read_claims_cache(cache_path, header)
+    if claims is None:
+        # Bytes in: the loader detects the encoding itself, skipping
+        # Python's locale-dependent text decoding layer
+        yaml, loader = _yaml_loader()
+        claims = yaml.load(claims_path.read_bytes(), Loader=loader)
+        _write_claims_cache(cache_path, header, claims)
+    return claims
+
+
+def _to_builtin(obj: Any) -> Any:
+    """json.dumps fallback for NumPy scalars returned by checks"""
+    if hasattr(obj, "item"):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _write_json_report(output: Dict) -> None:
+    """Write a report to stdout as indented JSON, serializing fully before writing"""
+    # Build the whole document first so a serialization error never leaves
+    # truncated JSON on stdout (CI redirects it into the report artifact)
+    if orjson is not None:
+        data = orjson.dumps(output, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        # ensure_ascii=False: raw UTF-8 like orjson, so the output matches
+        data = json.dumps(output, indent=2, ensure_ascii=False, default=_to_builtin).encode("utf-8")
+
+    # UTF-8 bytes go straight to the binary buffer when there is one
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is not None:
+        sys.stdout.flush()
+        buffer.write(data + b"\n")
+        buffer.flush()
+    else:
+        sys.stdout.write(data.decode("utf-8") + "\n")
+
 
 @dataclass
 class CheckResult:
@@ -42,30 +302,130 @@ class CheckResult:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
-        return asdict(self)
+        # Explicit literal: avoids asdict()'s recursive deep copy per result
+        return {
+            "id": self.id,
+            "name": self.name,
+            "category": self.category,
+            "severity": self.severity,
+            "passed": self.passed,
+            "details": self.details,
+            "hint": self.hint,
+        }
+
+
+class CheckSpec(NamedTuple):
+    """A registered check: its metadata plus the function that runs it"""
+    id: str
+    name: str
+    category: str
+    severity: str
+    func: Callable[[Dict], CheckResult]
+    position: int  # Registration order; reports follow it even with --only
+
+
+def _group_by_outcome(results: List[CheckResult]) -> Dict[str, List[CheckResult]]:
+    """Split results into "PASSED" plus one list per failing severity, in one pass"""
+    groups: Dict[str, List[CheckResult]] = {"PASSED": [], "ERROR": [], "WARNING": [], "INFO": []}
+    for r in results:
+        groups.setdefault("PASSED" if r.passed else r.severity, []).append(r)
+    return groups
 
 
 class VerificationFramework:
     """Framework for registering and running verification checks"""
 
     def __init__(self):
-        self._checks = []
-        self._claims = None
+        self._checks: List[CheckSpec] = []
+        self._by_category: Dict[str, List[CheckSpec]] = defaultdict(list)  # Index for --only
+        self._claims: Optional[Dict] = None
+        self._csv_cache: Dict[Tuple, Any] = {}  # (path, mtime_ns, comment) -> DataFrame
+        self._reduction_memo: Dict[Tuple, Dict] = {}  # (path, mtime_ns, size, fingerprint) -> result
         self._start_time = time.time()  # NEW: Track timing
 
     def load_claims(self) -> Dict:
         """Load numerical claims from YAML (single source of truth)"""
-        if not self._claims:
-            if not CLAIMS_FILE.exists():
-                raise FileNotFoundError(f"Contract missing: {CLAIMS_FILE}")
-            with open(CLAIMS_FILE) as f:
-                self._claims = yaml.safe_load(f)
+        if self._claims is None:
+            try:
+                st = CLAIMS_FILE.stat()
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Contract missing: {CLAIMS_FILE}") from None
+
+            self._claims = _load_claims_cached(str(CLAIMS_FILE), st.st_mtime_ns, st.st_size)
         return self._claims
 
+    def load_csv(self, path: Union[str, Path], comment: Optional[str] = "#"):
+        """
+        Load a CSV with pandas, shared by every check that reads the same file.
+
+        Unlike a bare pd.read_csv, text after `comment` ('#' by default) is
+        ignored on every line; pass comment=None for files whose values may
+        contain '#'. The DataFrame is memoized by (path, mtime, comment), so
+        checks must not modify it in place.
+        """
+        import pandas as pd  # Deferred: only CSV checks pay the import cost
+
+        key = (str(path), os.stat(path).st_mtime_ns, comment)
+        df = self._csv_cache.get(key)
+        if df is None:
+            df = self._csv_cache[key] = pd.read_csv(path, comment=comment)
+        return df
+
+    def cached_reduction(self, path: Path, fn: Callable[[Path], Dict], version: str = "") -> Dict:
+        """
+        Return fn(path), memoized on disk in CACHE_DIR.
+
+        Use this for checks that reduce a data file to a few numbers (means,
+        counts, ...). fn must depend only on the file bytes and return a
+        JSON-serializable dict. Within a process, results are also memoized
+        by (path, mtime, size) and fingerprint, which skips re-reading and
+        re-hashing the file.
+
+        Entries are keyed by the file's content hash plus a fingerprint of fn:
+        its name, bytecode, constants, default arguments, closure variables and
+        any plain-data globals it reads, so editing the data, fn's body or a
+        threshold it uses invalidates them. Closed-over values that are not
+        plain data raise TypeError. Global helper functions and modules fn
+        calls are not covered: bump `version` when one of them changes. Old
+        entries are never pruned; CACHE_DIR gains one file per change and is
+        safe to delete at any time.
+        """
+        fingerprint = _function_fingerprint(fn) + f"\0{version}".encode()
+        st = path.stat()
+        memo_key = (str(path), st.st_mtime_ns, st.st_size, fingerprint)
+        result = self._reduction_memo.get(memo_key)
+        if result is None:
+            result = self._reduction_memo[memo_key] = self._disk_cached_reduction(
+                path, fn, fingerprint
+            )
+        return result
+
+    def _disk_cached_reduction(self, path: Path, fn: Callable[[Path], Dict],
+                               fingerprint: bytes) -> Dict:
+        """Look up fn(path) in CACHE_DIR by content hash, computing it on a miss"""
+        h = _content_hasher(path.read_bytes())
+        h.update(b"\0" + fingerprint)
+        cache_path = CACHE_DIR / f"{h.hexdigest()}.json"
+
+        try:
+            return _json_loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            pass
+
+        result = fn(path)
+        try:
+            CACHE_DIR.mkdir(exist_ok=True)
+            _atomic_write(cache_path, json.dumps(result).encode("utf-8"))
+        except (OSError, TypeError, ValueError):
+            pass  # Caching is best effort
+        return result
+
     def register_check(self, id: str, name: str, category: str, severity: str = "ERROR"):
         """
         Decorator for registering a verification check.
 
+        Checks may run concurrently, so they must treat `claims` as read-only.
+
         Args:
             id: Unique check identifier (e.g., "FIG_001")
             name: Human-readable description
@@ -73,13 +433,9 @@ class VerificationFramework:
             severity: "ERROR", "WARNING", or "INFO"
         """
         def decorator(func: Callable[[Dict], CheckResult]):
-            self._checks.append({
-                "id": id,
-                "name": name,
-                "category": category,
-                "severity": severity,
-                "func": func
-            })
+            check = CheckSpec(id, name, category, severity, func, len(self._checks))
+            self._checks.append(check)
+            self._by_category[category].append(check)
             return func
         return decorator
 
@@ -94,29 +450,43 @@ class VerificationFramework:
             List of CheckResult objects
         """
         claims = self.load_claims()
-        results = []
 
-        for check in self._checks:
-            # NEW: Category filtering
-            if only_categories and check["category"] not in only_categories:
-                continue
-
-            try:
-                result = check['func'](claims)
-                results.append(result)
-            except Exception as e:
-                # Catch check failures and record as ERROR
-                results.append(CheckResult(
-                    id=check['id'],
-                    name=check['name'],
-                    category=check['category'],
-                    severity="ERROR",
-                    passed=False,
-                    details=f"Check raised exception: {type(e).__name__}: {e}",
-                    hint="Check implementation may have a bug"
-                ))
-
-        return results
+        # Category filtering via the index (duplicates in only_categories are
+        # ignored); results stay in registration order whatever order is given
+        if only_categories:
+            checks = sorted(
+                chain.from_iterable(
+                    self._by_category.get(c, []) for c in dict.fromkeys(only_categories)
+                ),
+                key=attrgetter("position"),
+            )
+        else:
+            checks = self._checks
+
+        if len(checks) <= 1:
+            return [self._safe_run(check, claims) for check in checks]
+
+        # Checks are I/O-bound and independent; overlap them on a thread pool.
+        # Results are collected in submission order so reports stay deterministic.
+        with ThreadPoolExecutor(max_workers=min(32, len(checks))) as ex:
+            futures = [ex.submit(self._safe_run, check, claims) for check in checks]
+            return [f.result() for f in futures]
+
+    def _safe_run(self, check: CheckSpec, claims: Dict) -> CheckResult:
+        """Run a single check, recording any exception as an ERROR result"""
+        try:
+            return check.func(claims)
+        except Exception as e:
+            # Catch check failures and record as ERROR
+            return CheckResult(
+                id=check.id,
+                name=check.name,
+                category=check.category,
+                severity="ERROR",
+                passed=False,
+                details=f"Check raised exception: {type(e).__name__}: {e}",
+                hint="Check implementation may have a bug"
+            )
 
     def report_human(self, results: List[CheckResult]) -> int:
         """
@@ -128,47 +498,47 @@ class VerificationFramework:
         elapsed = time.time() - self._start_time
 
         # NEW: Calculate statistics by severity
-        errors = [r for r in results if not r.passed and r.severity == "ERROR"]
-        warnings = [r for r in results if not r.passed and r.severity == "WARNING"]
-        info = [r for r in results if not r.passed and r.severity == "INFO"]
-        passed = [r for r in results if r.passed]
+        groups = _group_by_outcome(results)
+        errors, warnings, info = groups["ERROR"], groups["WARNING"], groups["INFO"]
+        passed = groups["PASSED"]
+
+        # Collect the report and write it once at the end
+        lines = []
 
         # Header
-        print("=" * 80)
-        print("MANUSCRIPT VERIFICATION REPORT")
-        print("=" * 80)
-        print()
-        print(f"Repository: {ROOT}")
-        print(f"Checks run: {len(results)}")
-        print(f"Time: {elapsed:.2f}s")
-        print()
+        lines.append("=" * 80)
+        lines.append("MANUSCRIPT VERIFICATION REPORT")
+        lines.append("=" * 80)
+        lines.append("")
+        lines.append(f"Repository: {ROOT}")
+        lines.append(f"Checks run: {len(results)}")
+        lines.append(f"Time: {elapsed:.2f}s")
+        lines.append("")
 
         # NEW: Summary statistics
         if errors or warnings:
-            print("❌ VERIFICATION FAILED")
+            lines.append("❌ VERIFICATION FAILED")
         else:
-            print("✅ ALL CHECKS PASSED")
+            lines.append("✅ ALL CHECKS PASSED")
 
-        print()
-        print(f"   Passed:   {len(passed)}/{len(results)}")
+        lines.append("")
+        lines.append(f"   Passed:   {len(passed)}/{len(results)}")
         if errors:
-            print(f"   Errors:   {len(errors)}")
+            lines.append(f"   Errors:   {len(errors)}")
         if warnings:
-            print(f"   Warnings: {len(warnings)}")
+            lines.append(f"   Warnings: {len(warnings)}")
         if info:
-            print(f"   Info:     {len(info)}")
-        print()
+            lines.append(f"   Info:     {len(info)}")
+        lines.append("")
 
         # Group results by category
-        categories = {}
+        categories = defaultdict(list)
         for r in results:
-            if r.category not in categories:
-                categories[r.category] = []
             categories[r.category].append(r)
 
         # Display by category
         for category, checks in sorted(categories.items()):
-            print(f"Category: {category}")
+            lines.append(f"Category: {category}")
             for r in checks:
                 icon = "✅" if r.passed else {
                     "ERROR": "❌",
@@ -176,21 +546,26 @@ class VerificationFramework:
                     "INFO": "ℹ️"
                 }.get(r.severity, "❌")
 
-                print(f"  {icon} [{r.id}] {r.name}")
+                lines.append(f"  {icon} [{r.id}] {r.name}")
                 if not r.passed:
-                    print(f"     Details: {r.details}")
+                    lines.append(f"     Details: {r.details}")
                     if r.hint:
-                        print(f"     Hint: {r.hint}")
-            print()
+                        lines.append(f"     Hint: {r.hint}")
+            lines.append("")
 
-        print("=" * 80)
+        lines.append("=" * 80)
 
         if errors or warnings:
-            print("⛔ FAILED: Critical inconsistencies detected.")
-            return 1
+            lines.append("⛔ FAILED: Critical inconsistencies detected.")
+            exit_code = 1
         else:
-            print("✨ SUCCESS: Manuscript is consistent.")
-            return 0
+            lines.append("✨ SUCCESS: Manuscript is consistent.")
+            exit_code = 0
+
+        # Emit the whole report with a single write
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        return exit_code
 
     def report_json(self, results: List[CheckResult]) -> int:
         """
@@ -200,8 +575,9 @@ class VerificationFramework:
             Exit code (0 = success, 1 = failure)
         """
         elapsed = time.time() - self._start_time
-        errors = [r for r in results if not r.passed and r.severity == "ERROR"]
-        warnings = [r for r in results if not r.passed and r.severity == "WARNING"]
+        groups = _group_by_outcome(results)
+        errors, warnings = groups["ERROR"], groups["WARNING"]
+        passed = len(groups["PASSED"])
 
         output = {
             "metadata": {
@@ -211,15 +587,15 @@ class VerificationFramework:
             },
             "summary": {
                 "total_checks": len(results),
-                "passed": len([r for r in results if r.passed]),
-                "failed": len([r for r in results if not r.passed]),
+                "passed": passed,
+                "failed": len(results) - passed,
                 "errors": len(errors),
                 "warnings": len(warnings)
             },
             "results": [r.to_dict() for r in results]
         }
 
-        print(json.dumps(output, indent=2))
+        _write_json_report(output)
         return 1 if (errors or warnings) else 0
 
 
@@ -243,29 +619,47 @@ def check_figures_exist(claims: Dict) -> CheckResult:
     SAFEGUARD: Trusts metadata file existence over timestamps (fixes fresh clone bug).
     """
     issues = []
-    for fig in claims.get('figures', {}).get('required', []):
-        fig_path = FIGURES_DIR / fig['filename']
+    figures = claims.get('figures', {}).get('required', [])
 
+    # One directory scan finds figures and sidecars; a DirEntry caches its stat
+    # result. Names not listed (e.g. nested paths) fall back to a plain stat.
+    try:
+        with os.scandir(FIGURES_DIR) as it:
+            entries = {e.name: e for e in it}
+    except OSError:
+        entries = {}
+
+    def stat_figure_file(name: str) -> Optional[os.stat_result]:
+        """stat() a file under FIGURES_DIR (following symlinks); None if missing"""
+        entry = entries.get(name)
+        if entry is None:
+            return _stat_or_none(FIGURES_DIR / name)
+        try:
+            return entry.stat()  # Raises for dangling or looping symlinks
+        except OSError:
+            return None
+
+    for fig in figures:
         # 1. Existence check
-        if not fig_path.exists():
+        fig_st = stat_figure_file(fig['filename'])
+        if fig_st is None:
             issues.append(f"Missing: {fig['filename']}")
             continue
 
         # 2. Freshness check (with metadata safeguard)
         if 'generator' in fig:
-            script_path = ROOT / fig['generator']
-            if script_path.exists():
-                # If we have a metadata sidecar, trust content check instead of timestamps
-                # This prevents false positives on fresh git clones
-                metadata_file = fig.get('metadata_file', '')
-                if metadata_file:
-                    metadata_path = FIGURES_DIR / metadata_file
-                    if metadata_path.exists():
-                        continue  # Trust metadata check instead
-
-                # Fallback to timestamp check
-                if fig_path.stat().st_mtime < script_path.stat().st_mtime:
-                    issues.append(f"Stale: {fig['filename']} (older than script)")
+            # If we have a metadata sidecar, trust content check instead of timestamps
+            # This prevents false positives on fresh git clones
+            metadata_file = fig.get('metadata_file', '')
+            if metadata_file and stat_figure_file(metadata_file) is not None:
+                continue  # Trust metadata check instead
+
+            # Fallback to timestamp check (only stat the script when actually needed)
+            script_st = _stat_or_none(ROOT / fig['generator'])
+            if script_st is None:
+                continue
+            if fig_st.st_mtime < script_st.st_mtime:
+                issues.append(f"Stale: {fig['filename']} (older than script)")
 
     return CheckResult(
         id="FIG_001",
@@ -273,7 +667,7 @@ def check_figures_exist(claims: Dict) -> CheckResult:
         category="figures",
         severity="WARNING",
         passed=len(issues) == 0,
-        details="; ".join(issues) if issues else f"All {len(claims.get('figures', {}).get('required', []))} figures OK",
+        details="; ".join(issues) if issues else f"All {len(figures)} figures OK",
         hint="Run: python3 scripts/example_analysis.py" if issues else ""
     )
 
@@ -287,7 +681,7 @@ def check_figures_exist(claims: Dict) -> CheckResult:
 def check_data_consistency(claims: Dict) -> CheckResult:
     """Example: Checks if calculated values match the contract"""
     # In a real implementation, this would load actual data:
-    # df = pd.read_csv(DATA_DIR / "results.csv")
+    # df = framework.load_csv(DATA_DIR / "results.csv")
     # csv_calculated_mean = df['efficiency'].mean()
 
     # For the template, we use the metadata from example_analysis.py
@@ -305,8 +699,7 @@ def check_data_consistency(claims: Dict) -> CheckResult:
         )
 
     # Load metadata
-    with open(metadata_path) as f:
-        metadata = json.load(f)
+    metadata = _json_loads(metadata_path.read_bytes())
 
     calculated = metadata['key_values']['mean_efficiency']
     expected = claims['results']['experiment_a']['mean_efficiency']